@@ -11,7 +11,7 @@ from homeassistant.components.button import (
     ButtonEntity,
     ButtonEntityDescription,
 )
-from homeassistant.const import ATTR_SERIAL_NUMBER, CONF_TYPE, EntityCategory
+from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -72,12 +72,7 @@ async def async_setup_entry(
         buttons_to_be_used = BUTTONS_FOR_LB_DEVICES
 
     async_add_entities(
-        LektricoButton(
-            description,
-            coordinator,
-            f"{entry.data[CONF_TYPE]}_{entry.data[ATTR_SERIAL_NUMBER]}",
-        )
-        for description in buttons_to_be_used
+        LektricoButton(description, coordinator) for description in buttons_to_be_used
     )
 
 
@@ -90,10 +85,9 @@ class LektricoButton(LektricoEntity, ButtonEntity):
         self,
         description: LektricoButtonEntityDescription,
         coordinator: LektricoDeviceDataUpdateCoordinator,
-        device_name: str,
     ) -> None:
         """Initialize Lektrico button."""
-        super().__init__(coordinator, device_name)
+        super().__init__(coordinator)
         self.entity_description = description
         self._attr_unique_id = f"{coordinator.serial_number}-{description.key}"
 
@@ -6,6 +6,7 @@ from datetime import timedelta
 from typing import Any
 
 from lektricowifi import Device, DeviceConnectionError
+from propcache import cached_property
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
@@ -15,10 +16,11 @@ from homeassistant.const import (
     CONF_TYPE,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.httpx_client import get_async_client
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import LOGGER
+from .const import DOMAIN, LOGGER
 
 SCAN_INTERVAL = timedelta(seconds=10)
 
@@ -44,6 +46,19 @@ class LektricoDeviceDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]])
         self.board_revision: str = self.config_entry.data[ATTR_HW_VERSION]
         self.device_type: str = self.config_entry.data[CONF_TYPE]
 
+    @cached_property
+    def device_info(self) -> DeviceInfo:
+        """Return the device info shared by all entities of this device."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, self.serial_number)},
+            model=self.device_type.upper(),
+            name=self.name,
+            manufacturer="Lektrico",
+            sw_version=self.data["fw_version"],
+            hw_version=self.board_revision,
+            serial_number=self.serial_number,
+        )
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Async Update device state."""
         try:
@@ -2,11 +2,9 @@
 
 from __future__ import annotations
 
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import LektricoDeviceDataUpdateCoordinator
-from .const import DOMAIN
 
 
 class LektricoEntity(CoordinatorEntity[LektricoDeviceDataUpdateCoordinator]):
@@ -14,20 +12,8 @@ class LektricoEntity(CoordinatorEntity[LektricoDeviceDataUpdateCoordinator]):
 
     _attr_has_entity_name = True
 
-    def __init__(
-        self,
-        coordinator: LektricoDeviceDataUpdateCoordinator,
-        device_name: str,
-    ) -> None:
+    def __init__(self, coordinator: LektricoDeviceDataUpdateCoordinator) -> None:
         """Initialize."""
         super().__init__(coordinator)
 
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, coordinator.serial_number)},
-            model=coordinator.device_type.upper(),
-            name=device_name,
-            manufacturer="Lektrico",
-            sw_version=coordinator.data["fw_version"],
-            hw_version=coordinator.board_revision,
-            serial_number=coordinator.serial_number,
-        )
+        self._attr_device_info = coordinator.device_info
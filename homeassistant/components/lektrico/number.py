@@ -2,14 +2,13 @@
 
 from collections.abc import Callable, Coroutine
 from dataclasses import dataclass
+from operator import itemgetter
 from typing import Any
 
 from lektricowifi import Device
 
 from homeassistant.components.number import NumberEntity, NumberEntityDescription
 from homeassistant.const import (
-    ATTR_SERIAL_NUMBER,
-    CONF_TYPE,
     PERCENTAGE,
     EntityCategory,
     UnitOfElectricCurrent,
@@ -38,7 +37,7 @@ NUMBERS: tuple[LektricoNumberEntityDescription, ...] = (
         native_max_value=100,
         native_step=5,
         native_unit_of_measurement=PERCENTAGE,
-        value_fn=lambda data: int(data["led_max_brightness"]),
+        value_fn=itemgetter("led_max_brightness"),
         set_value_fn=lambda data, value: data.set_led_max_brightness(value),
     ),
     LektricoNumberEntityDescription(
@@ -49,7 +48,7 @@ NUMBERS: tuple[LektricoNumberEntityDescription, ...] = (
         native_max_value=32,
         native_step=1,
         native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        value_fn=lambda data: int(data["dynamic_current"]),
+        value_fn=itemgetter("dynamic_current"),
         set_value_fn=lambda data, value: data.set_dynamic_current(value),
     ),
 )
@@ -64,12 +63,7 @@ async def async_setup_entry(
     coordinator = entry.runtime_data
 
     async_add_entities(
-        LektricoNumber(
-            description,
-            coordinator,
-            f"{entry.data[CONF_TYPE]}_{entry.data[ATTR_SERIAL_NUMBER]}",
-        )
-        for description in NUMBERS
+        LektricoNumber(description, coordinator) for description in NUMBERS
     )
 
 
@@ -82,10 +76,9 @@ class LektricoNumber(LektricoEntity, NumberEntity):
         self,
         description: LektricoNumberEntityDescription,
         coordinator: LektricoDeviceDataUpdateCoordinator,
-        device_name: str,
     ) -> None:
         """Initialize Lektrico number."""
-        super().__init__(coordinator, device_name)
+        super().__init__(coordinator)
         self.entity_description = description
         self._attr_unique_id = f"{coordinator.serial_number}_{description.key}"
 
@@ -7,7 +7,7 @@ from typing import Any
 from lektricowifi import Device
 
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
-from homeassistant.const import ATTR_SERIAL_NUMBER, CONF_TYPE, EntityCategory
+from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -53,12 +53,7 @@ async def async_setup_entry(
     coordinator = entry.runtime_data
 
     async_add_entities(
-        LektricoSelect(
-            description,
-            coordinator,
-            f"{entry.data[CONF_TYPE]}_{entry.data[ATTR_SERIAL_NUMBER]}",
-        )
-        for description in SELECTS
+        LektricoSelect(description, coordinator) for description in SELECTS
     )
 
 
@@ -71,10 +66,9 @@ class LektricoSelect(LektricoEntity, SelectEntity):
         self,
         description: LektricoSelectEntityDescription,
         coordinator: LektricoDeviceDataUpdateCoordinator,
-        device_name: str,
     ) -> None:
         """Initialize Lektrico select."""
-        super().__init__(coordinator, device_name)
+        super().__init__(coordinator)
         self.entity_description = description
         self._attr_unique_id = f"{coordinator.serial_number}_{description.key}"
 
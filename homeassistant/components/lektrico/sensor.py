@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from operator import itemgetter
 from typing import Any
 
 from lektricowifi import Device
@@ -15,8 +16,6 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.const import (
-    ATTR_SERIAL_NUMBER,
-    CONF_TYPE,
     PERCENTAGE,
     UnitOfElectricCurrent,
     UnitOfElectricPotential,
@@ -70,14 +69,14 @@ SENSORS_FOR_CHARGERS: tuple[LektricoSensorEntityDescription, ...] = (
             "updating_firmware",
         ],
         translation_key="state",
-        value_fn=lambda data: str(data["charger_state"]),
+        value_fn=itemgetter("charger_state"),
     ),
     LektricoSensorEntityDescription(
         key="charging_time",
         translation_key="charging_time",
         device_class=SensorDeviceClass.DURATION,
         native_unit_of_measurement=UnitOfTime.SECONDS,
-        value_fn=lambda data: int(data["charging_time"]),
+        value_fn=itemgetter("charging_time"),
     ),
     LektricoSensorEntityDescription(
         key="power",
@@ -85,20 +84,20 @@ SENSORS_FOR_CHARGERS: tuple[LektricoSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfPower.WATT,
         suggested_unit_of_measurement=UnitOfPower.KILO_WATT,
-        value_fn=lambda data: float(data["instant_power"]),
+        value_fn=itemgetter("instant_power"),
     ),
     LektricoSensorEntityDescription(
         key="energy",
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        value_fn=lambda data: float(data["session_energy"]) / 1000,
+        value_fn=lambda data: data["session_energy"] / 1000,
     ),
     LektricoSensorEntityDescription(
         key="temperature",
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        value_fn=lambda data: float(data["temperature"]),
+        value_fn=itemgetter("temperature"),
     ),
     LektricoSensorEntityDescription(
         key="lifetime_energy",
@@ -113,7 +112,7 @@ SENSORS_FOR_CHARGERS: tuple[LektricoSensorEntityDescription, ...] = (
         translation_key="installation_current",
         device_class=SensorDeviceClass.CURRENT,
         native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        value_fn=lambda data: int(data["install_current"]),
+        value_fn=itemgetter("install_current"),
     ),
     LektricoSensorEntityDescription(
         key="limit_reason",
@@ -121,8 +120,8 @@ SENSORS_FOR_CHARGERS: tuple[LektricoSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.ENUM,
         options=LIMIT_REASON_OPTIONS,
         value_fn=lambda data: (
-            str(data["current_limit_reason"])
-            if str(data["current_limit_reason"]) in LIMIT_REASON_OPTIONS
+            data["current_limit_reason"]
+            if data["current_limit_reason"] in LIMIT_REASON_OPTIONS
             else None
         ),
     ),
@@ -135,7 +134,7 @@ SENSORS_FOR_LB_DEVICES: tuple[LektricoSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        value_fn=lambda data: int(data["breaker_curent"]),
+        value_fn=itemgetter("breaker_curent"),
     ),
 )
 
@@ -144,14 +143,14 @@ SENSORS_FOR_1_PHASE: tuple[LektricoSensorEntityDescription, ...] = (
         key="voltage",
         device_class=SensorDeviceClass.VOLTAGE,
         native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        value_fn=lambda data: float(data["voltage_l1"]),
+        value_fn=itemgetter("voltage_l1"),
     ),
     LektricoSensorEntityDescription(
         key="current",
         device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        value_fn=lambda data: float(data["current_l1"]),
+        value_fn=itemgetter("current_l1"),
     ),
 )
 
@@ -161,21 +160,21 @@ SENSORS_FOR_3_PHASE: tuple[LektricoSensorEntityDescription, ...] = (
         translation_key="voltage_l1",
         device_class=SensorDeviceClass.VOLTAGE,
         native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        value_fn=lambda data: float(data["voltage_l1"]),
+        value_fn=itemgetter("voltage_l1"),
     ),
     LektricoSensorEntityDescription(
         key="voltage_l2",
         translation_key="voltage_l2",
         device_class=SensorDeviceClass.VOLTAGE,
         native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        value_fn=lambda data: float(data["voltage_l2"]),
+        value_fn=itemgetter("voltage_l2"),
     ),
     LektricoSensorEntityDescription(
         key="voltage_l3",
         translation_key="voltage_l3",
         device_class=SensorDeviceClass.VOLTAGE,
         native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        value_fn=lambda data: float(data["voltage_l3"]),
+        value_fn=itemgetter("voltage_l3"),
     ),
     LektricoSensorEntityDescription(
         key="current_l1",
@@ -183,7 +182,7 @@ SENSORS_FOR_3_PHASE: tuple[LektricoSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        value_fn=lambda data: float(data["current_l1"]),
+        value_fn=itemgetter("current_l1"),
     ),
     LektricoSensorEntityDescription(
         key="current_l2",
@@ -191,7 +190,7 @@ SENSORS_FOR_3_PHASE: tuple[LektricoSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        value_fn=lambda data: float(data["current_l2"]),
+        value_fn=itemgetter("current_l2"),
     ),
     LektricoSensorEntityDescription(
         key="current_l3",
@@ -199,7 +198,7 @@ SENSORS_FOR_3_PHASE: tuple[LektricoSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        value_fn=lambda data: float(data["current_l3"]),
+        value_fn=itemgetter("current_l3"),
     ),
 )
 
@@ -211,14 +210,14 @@ SENSORS_FOR_LB_1_PHASE: tuple[LektricoSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfPower.WATT,
         suggested_unit_of_measurement=UnitOfPower.KILO_WATT,
-        value_fn=lambda data: float(data["power_l1"]),
+        value_fn=itemgetter("power_l1"),
     ),
     LektricoSensorEntityDescription(
         key="pf",
         device_class=SensorDeviceClass.POWER_FACTOR,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=PERCENTAGE,
-        value_fn=lambda data: float(data["power_factor_l1"]) * 100,
+        value_fn=lambda data: data["power_factor_l1"] * 100,
     ),
 )
 
@@ -231,7 +230,7 @@ SENSORS_FOR_LB_3_PHASE: tuple[LektricoSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfPower.WATT,
         suggested_unit_of_measurement=UnitOfPower.KILO_WATT,
-        value_fn=lambda data: float(data["power_l1"]),
+        value_fn=itemgetter("power_l1"),
     ),
     LektricoSensorEntityDescription(
         key="power_l2",
@@ -240,7 +239,7 @@ SENSORS_FOR_LB_3_PHASE: tuple[LektricoSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfPower.WATT,
         suggested_unit_of_measurement=UnitOfPower.KILO_WATT,
-        value_fn=lambda data: float(data["power_l2"]),
+        value_fn=itemgetter("power_l2"),
     ),
     LektricoSensorEntityDescription(
         key="power_l3",
@@ -249,7 +248,7 @@ SENSORS_FOR_LB_3_PHASE: tuple[LektricoSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfPower.WATT,
         suggested_unit_of_measurement=UnitOfPower.KILO_WATT,
-        value_fn=lambda data: float(data["power_l3"]),
+        value_fn=itemgetter("power_l3"),
     ),
     LektricoSensorEntityDescription(
         key="pf_l1",
@@ -257,7 +256,7 @@ SENSORS_FOR_LB_3_PHASE: tuple[LektricoSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.POWER_FACTOR,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=PERCENTAGE,
-        value_fn=lambda data: float(data["power_factor_l1"]) * 100,
+        value_fn=lambda data: data["power_factor_l1"] * 100,
     ),
     LektricoSensorEntityDescription(
         key="pf_l2",
@@ -265,7 +264,7 @@ SENSORS_FOR_LB_3_PHASE: tuple[LektricoSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.POWER_FACTOR,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=PERCENTAGE,
-        value_fn=lambda data: float(data["power_factor_l2"]) * 100,
+        value_fn=lambda data: data["power_factor_l2"] * 100,
     ),
     LektricoSensorEntityDescription(
         key="pf_l3",
@@ -273,11 +272,23 @@ SENSORS_FOR_LB_3_PHASE: tuple[LektricoSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.POWER_FACTOR,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=PERCENTAGE,
-        value_fn=lambda data: float(data["power_factor_l3"]) * 100,
+        value_fn=lambda data: data["power_factor_l3"] * 100,
     ),
 )
 
 
+SENSORS_FOR_DEVICE_TYPE: dict[str, tuple[LektricoSensorEntityDescription, ...]] = {
+    Device.TYPE_1P7K: SENSORS_FOR_CHARGERS + SENSORS_FOR_1_PHASE,
+    Device.TYPE_3P22K: SENSORS_FOR_CHARGERS + SENSORS_FOR_3_PHASE,
+    Device.TYPE_EM: (
+        SENSORS_FOR_LB_DEVICES + SENSORS_FOR_1_PHASE + SENSORS_FOR_LB_1_PHASE
+    ),
+    Device.TYPE_3EM: (
+        SENSORS_FOR_LB_DEVICES + SENSORS_FOR_3_PHASE + SENSORS_FOR_LB_3_PHASE
+    ),
+}
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: LektricoConfigEntry,
@@ -286,29 +297,13 @@ async def async_setup_entry(
     """Set up Lektrico charger based on a config entry."""
     coordinator = entry.runtime_data
 
-    sensors_to_be_used: tuple[LektricoSensorEntityDescription, ...]
-    if coordinator.device_type == Device.TYPE_1P7K:
-        sensors_to_be_used = SENSORS_FOR_CHARGERS + SENSORS_FOR_1_PHASE
-    elif coordinator.device_type == Device.TYPE_3P22K:
-        sensors_to_be_used = SENSORS_FOR_CHARGERS + SENSORS_FOR_3_PHASE
-    elif coordinator.device_type == Device.TYPE_EM:
-        sensors_to_be_used = (
-            SENSORS_FOR_LB_DEVICES + SENSORS_FOR_1_PHASE + SENSORS_FOR_LB_1_PHASE
-        )
-    elif coordinator.device_type == Device.TYPE_3EM:
-        sensors_to_be_used = (
-            SENSORS_FOR_LB_DEVICES + SENSORS_FOR_3_PHASE + SENSORS_FOR_LB_3_PHASE
-        )
-    else:
-        raise IntegrationError
+    try:
+        sensors_to_be_used = SENSORS_FOR_DEVICE_TYPE[coordinator.device_type]
+    except KeyError as err:
+        raise IntegrationError from err
 
     async_add_entities(
-        LektricoSensor(
-            description,
-            coordinator,
-            f"{entry.data[CONF_TYPE]}_{entry.data[ATTR_SERIAL_NUMBER]}",
-        )
-        for description in sensors_to_be_used
+        [LektricoSensor(description, coordinator) for description in sensors_to_be_used]
     )
 
 
@@ -321,10 +316,9 @@ class LektricoSensor(LektricoEntity, SensorEntity):
         self,
         description: LektricoSensorEntityDescription,
         coordinator: LektricoDeviceDataUpdateCoordinator,
-        device_name: str,
     ) -> None:
         """Initialize Lektrico charger."""
-        super().__init__(coordinator, device_name)
+        super().__init__(coordinator)
         self.entity_description = description
         self._attr_unique_id = f"{coordinator.serial_number}_{description.key}"
 